@@ -10,7 +10,8 @@ from __future__ import annotations
 
 import asyncio
 import re
-from typing import Any, Dict, List, Optional, Set
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from ..services.geocode import geocode_place, geocode_top_match, GeocodeResult
 from ..utils.logging_config import logger
@@ -19,61 +20,119 @@ from ..utils.logging_config import logger
 from .weather_agent import fetch_weather  # type: ignore  # noqa: F401,E402
 from .places_agent import fetch_places  # type: ignore  # noqa: F401,E402
 
-PLACE_REGEX = re.compile(r"\b(?:in|at|for|to|about)\s+([A-Z][A-Za-z0-9'\- ]{2,})", re.IGNORECASE)
-INTENT_WEATHER_KEYWORDS = {"weather", "temperature", "rain", "sunny", "forecast", "climate", "hot", "cold"}
-INTENT_PLACES_KEYWORDS = {"place", "places", "attraction", "attractions", "visit", "tour", "tourist", "poi", "park", "about", "tell", "show"}
+PLACE_REGEX = re.compile(r"\b(?:in|at|for|to|about)\s+([A-Z][\w'\-]+(?:\s+[A-Z][\w'\-]*)*)", re.IGNORECASE)
+# Fallback: first run of capitalized words (e.g. "New York"); case-sensitive on purpose.
+_CAP_RUN_RE = re.compile(r"\b[A-Z][A-Za-z]{2,}(?:\s+[A-Z][A-Za-z]+)*\b")
+# Capitalized words that start a request rather than name a place ("Show me
+# Tokyo", "How hot is Delhi"); stripped from the front of a fallback run.
+_FALLBACK_SKIP_WORDS = frozenset({
+    "show", "tell", "me", "what", "whats", "how", "is", "are", "will", "can",
+    "could", "would", "should", "does", "do", "plan", "find", "give", "list",
+    "suggest", "recommend", "visit", "trip", "weather", "forecast", "places",
+    "please", "hey", "hello", "when", "where", "which", "let", "lets",
+})
+_WS_RE = re.compile(r"\s+")
+INTENT_WEATHER_KEYWORDS = frozenset({"weather", "temperature", "rain", "sunny", "forecast", "climate", "hot", "cold"})
+INTENT_PLACES_KEYWORDS = frozenset({"place", "places", "attraction", "attractions", "visit", "tour", "tourist", "poi", "park", "about", "tell", "show"})
+
+
+def _keyword_alternation(keywords: FrozenSet[str]) -> str:
+    # Longest keywords first so e.g. "attractions" wins over "attraction".
+    return "|".join(map(re.escape, sorted(keywords, key=lambda k: (-len(k), k))))
+
+
+# One compiled pass over the message with a named group per intent (plain
+# substring semantics, matching the previous `k in lowered` checks). Hits are
+# OR-ed into a bitmask which indexes the precomputed result sets.
+_INTENT_RE = re.compile(
+    f"(?P<weather>{_keyword_alternation(INTENT_WEATHER_KEYWORDS)})"
+    f"|(?P<places>{_keyword_alternation(INTENT_PLACES_KEYWORDS)})"
+)
+_INTENT_BITS: Dict[str, int] = {"weather": 1, "places": 2}
+_ALL_INTENTS_MASK = 3
+_INTENTS_BY_MASK = (
+    frozenset({"places"}),  # neither found: default to places only
+    frozenset({"weather"}),
+    frozenset({"places"}),
+    frozenset({"weather", "places"}),
+)
 
 
 def extract_place_from_text(message: str) -> Optional[str]:
     """Attempt to extract a place-like token from the message.
 
     Heuristic: look for prepositions (in/at/for/to/about) followed by a capitalized
-    segment. This is intentionally naive but lightweight.
+    segment (short names such as "NY" are kept). This is intentionally naive
+    but lightweight. Results are memoized per message, since popular queries
+    repeat verbatim.
+
+    Otherwise the first run of capitalized words is used, minus leading request
+    words ("Show me Tokyo" -> "Tokyo"); later runs are not joined on, so
+    "Kyoto and Osaka" -> "Kyoto".
 
     If not found, we return None and rely on geocoding attempts in orchestrate.
     """
+    if len(message) > _MAX_CACHED_MESSAGE_LEN:
+        return _extract_place(message)
+    return _extract_place_cached(message)
+
+
+def _extract_place(message: str) -> Optional[str]:
     match = PLACE_REGEX.search(message)
     if match:
-        candidate = match.group(1).strip()
         # Basic cleanup: collapse spaces
-        candidate = re.sub(r"\s+", " ", candidate)
+        candidate = _WS_RE.sub(" ", match.group(1))
         logger.debug("Extracted place heuristic", candidate=candidate)
         return candidate
-    
-    # Fallback: extract capitalized words that might be place names
-    words = message.split()
-    capitalized = [w for w in words if w and w[0].isupper() and len(w) > 2]
-    if capitalized:
-        # Join consecutive capitalized words (e.g., "New York")
-        place_candidate = " ".join(capitalized)
-        logger.debug("Extracted place from capitalized words", candidate=place_candidate)
-        return place_candidate
+
+    # Fallback: first run of consecutive capitalized words (e.g., "New York"),
+    # ignoring leading request words; a run made only of those is skipped.
+    for cap_match in _CAP_RUN_RE.finditer(message):
+        words = cap_match.group().split()
+        start = 0
+        while start < len(words) and words[start].lower() in _FALLBACK_SKIP_WORDS:
+            start += 1
+        if start < len(words):
+            place_candidate = " ".join(words[start:])
+            logger.debug("Extracted place from capitalized words", candidate=place_candidate)
+            return place_candidate
     
     logger.debug("No heuristic place extracted")
     return None
 
 
-def detect_intent(message: str) -> Set[str]:
+def detect_intent(message: str, already_lower: bool = False) -> FrozenSet[str]:
     """Detect user intent for weather / places.
 
-    Returns a set containing any of {"weather", "places"}.
+    Returns a frozenset containing any of {"weather", "places"} (immutable so
+    the memoized result can be shared between callers).
     If both are present, returns both. If neither, defaults to only places.
+    Pass already_lower=True when the caller has lowercased the message itself.
     """
-    lowered = message.lower()
-    intents: Set[str] = set()
-    found_weather = any(k in lowered for k in INTENT_WEATHER_KEYWORDS)
-    found_places = any(k in lowered for k in INTENT_PLACES_KEYWORDS)
-    if found_weather:
-        intents.add("weather")
-    if found_places:
-        intents.add("places")
-    if not intents:
-        # If neither intent is found, default to places only
-        intents.add("places")
+    if len(message) > _MAX_CACHED_MESSAGE_LEN:
+        return _detect_intent(message, already_lower)
+    return _detect_intent_cached(message, already_lower)
+
+
+def _detect_intent(message: str, already_lower: bool) -> FrozenSet[str]:
+    lowered = message if already_lower else message.lower()
+    mask = 0
+    for m in _INTENT_RE.finditer(lowered):
+        mask |= _INTENT_BITS[m.lastgroup]
+        if mask == _ALL_INTENTS_MASK:
+            break
+    intents = _INTENTS_BY_MASK[mask]
     logger.debug("Detected intent", intents=list(intents))
     return intents
 
 
+# Memoized variants; messages are capped at 500 chars by the API, longer
+# inputs bypass the cache so pathological payloads cannot pin large keys.
+_MAX_CACHED_MESSAGE_LEN = 500
+_extract_place_cached = lru_cache(maxsize=4096)(_extract_place)
+_detect_intent_cached = lru_cache(maxsize=4096)(_detect_intent)
+
+
 async def _resolve_place(candidate: Optional[str]) -> Optional[GeocodeResult]:
     """Resolve geocode result for candidate or None if unknown.
 
@@ -134,53 +193,57 @@ async def orchestrate(place_candidate: Optional[str], want: List[str]) -> Dict[s
     lat, lon = geocode.lat, geocode.lon
     logger.info("Resolved place", place=geocode.display_name, lat=lat, lon=lon)
 
-    # Prepare tasks based on intent
-    tasks = {}
-    if "weather" in want:
-        tasks["weather"] = asyncio.create_task(_run_weather(lat, lon))
-    if "places" in want:
-        tasks["places"] = asyncio.create_task(_run_places(lat, lon))
-
-    # Await all with exception capture
-    await asyncio.gather(*tasks.values(), return_exceptions=True)
+    # Run child agents based on intent. The _run_* wrappers turn ordinary
+    # failures into fallback values, so the TaskGroup only tears the siblings
+    # down on cancellation or a genuine bug.
+    weather_task: Optional[asyncio.Task[Dict[str, Any]]] = None
+    places_task: Optional[asyncio.Task[List[Dict[str, Any]]]] = None
+    async with asyncio.TaskGroup() as tg:
+        if "weather" in want:
+            weather_task = tg.create_task(_run_weather(lat, lon))
+        if "places" in want:
+            places_task = tg.create_task(_run_places(lat, lon))
 
     weather_block: Optional[Dict[str, Any]] = None
     places_block: Optional[List[str]] = None
     places_geo: Optional[List[Dict[str, Any]]] = None
 
-    if "weather" in tasks:
-        weather_block = tasks["weather"].result()  # type: ignore[assignment]
-    if "places" in tasks:
-        raw_places: List[Dict[str, Any]] = tasks["places"].result()  # type: ignore[assignment]
+    if weather_task is not None:
+        weather_block = weather_task.result()
+    if places_task is not None:
+        raw_places = places_task.result()
         places_geo = raw_places
         places_block = [p.get("name") for p in raw_places]
 
-    # Compose natural language summary based on requested intent
+    # Compose natural language summary based on requested intent. Blocks are
+    # only populated for requested intents, so they double as the intent check.
+    place_name = geocode.display_name
+    weather_ok = bool(weather_block) and not weather_block.get("error")
     summary_parts: List[str] = []
 
-    if "weather" in want and weather_block and not weather_block.get("error"):
+    if weather_ok:
         temp = weather_block.get("temperature")
         precip = weather_block.get("precipitation_probability")
         if temp is not None and precip is not None:
-            summary_parts.append(f"In {geocode.display_name} it’s currently {temp:.0f}°C with a chance of {precip}% to rain.")
+            summary_parts.append(f"In {place_name} it’s currently {temp:.0f}°C with a chance of {precip}% to rain.")
         elif temp is not None:
-            summary_parts.append(f"In {geocode.display_name} it’s currently {temp:.0f}°C.")
+            summary_parts.append(f"In {place_name} it’s currently {temp:.0f}°C.")
     elif "weather" in want:
         errors.append("Weather service unavailable")
 
-    if "places" in want and places_block:
+    if places_block:
         listed = "\n".join(places_block)
-        if "weather" in want and weather_block and not weather_block.get("error"):
+        if weather_ok:
             summary_parts.append(f"And these are the places you can go:\n{listed}")
         else:
-            summary_parts.append(f"In {geocode.display_name} these are the places you can go, \n{listed}")
+            summary_parts.append(f"In {place_name} these are the places you can go, \n{listed}")
     elif "places" in want:
         errors.append("Places service unavailable")
 
     text_summary = " ".join(summary_parts) if summary_parts else "No data available."
 
     return {
-        "place": geocode.display_name,
+        "place": place_name,
         "lat": lat,
         "lon": lon,
         "geocode_source": getattr(geocode, "source", None),
@@ -1,10 +1,12 @@
 """Places child agent.
 
-Fetches tourist points of interest using Overpass with radius expansion
-retry if initial results fewer than desired limit.
+Fetches tourist points of interest using Overpass. The initial radius and its
+expansions are queried concurrently and merged, nearest radius first, until
+the desired limit.
 """
 from __future__ import annotations
 
+import asyncio
 from typing import Any, Dict, List
 
 from ..services.overpass import fetch_pois
@@ -25,7 +27,11 @@ async def _fetch(lat: float, lon: float, radius: int, limit: int) -> List[Dict[s
 
 
 async def fetch_places(lat: float, lon: float, radius: int = DEFAULT_RADIUS, limit: int = POI_LIMIT) -> List[Dict[str, Any]]:
-    """Fetch places with minimal retry plus radius expansion if needed.
+    """Fetch places with minimal retry, querying all radii concurrently.
+
+    Results from the initial radius take precedence; wider radii only top the
+    list up. If the initial radius alone fills the limit, the wider queries
+    still in flight are cancelled.
 
     Args:
         lat: Latitude.
@@ -35,26 +41,37 @@ async def fetch_places(lat: float, lon: float, radius: int = DEFAULT_RADIUS, lim
     Returns:
         List of POI dicts with 'name' and optional 'category'.
     """
-    current_radius = radius
-    expansions = 0
+    # Query every expansion radius concurrently, so a short initial result costs
+    # no extra round-trip, but merge in radius order so nearer POIs win.
+    # Whatever is still pending once we have enough is cancelled; ttl_cache
+    # propagates that to the Overpass request unless another caller is
+    # waiting on the same radius.
+    radii = [radius * RADIUS_EXPANSION_FACTOR ** i for i in range(MAX_EXPANSIONS + 1)]
+    logger.debug("Places fetch dispatch", radii=radii)
+    tasks = [asyncio.create_task(_fetch(lat, lon, r, limit)) for r in radii]
     all_places: List[Dict[str, Any]] = []
+    seen: set[str] = set()
+
+    try:
+        for task in tasks:
+            try:
+                places = await task
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Places fetch error", error=str(exc))
+                continue
+            # Deduplicate across radii, stopping as soon as we have enough
+            for p in places:
+                name = p.get("name")
+                if name and name not in seen:
+                    seen.add(name)
+                    all_places.append(p)
+                    if len(all_places) >= limit:
+                        break
+            if len(all_places) >= limit:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
 
-    while expansions <= MAX_EXPANSIONS:
-        logger.debug("Places fetch attempt", radius=current_radius, expansions=expansions)
-        try:
-            places = await _fetch(lat, lon, current_radius, limit)
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("Places fetch error", error=str(exc))
-            places = []
-        # Deduplicate across expansions
-        dedup: Dict[str, Dict[str, Any]] = {p["name"]: p for p in (all_places + places) if p.get("name")}
-        all_places = list(dedup.values())
-        if len(all_places) >= limit:
-            break
-        current_radius *= RADIUS_EXPANSION_FACTOR
-        expansions += 1
-
-    # Truncate to limit
-    all_places = all_places[:limit]
     logger.debug("Places final", count=len(all_places))
     return all_places
@@ -1,7 +1,7 @@
 """Weather child agent.
 
 Fetches weather data via Open-Meteo service helper with retry logic.
-Implements exponential backoff on transient failures.
+Implements jittered exponential backoff on transient failures.
 """
 from __future__ import annotations
 
@@ -11,7 +11,7 @@ from ..services.open_meteo import fetch_open_meteo
 from ..utils.retry import async_retry
 from ..utils.logging_config import logger
 
-# Apply retries: 3 attempts exponential backoff base 0.5s -> 0.5, 1.0, 2.0
+# Apply retries: 3 attempts, full-jitter backoff -> waits drawn from [0, 0.5s], then [0, 1.0s]
 @async_retry(retries=3, backoff_factor=0.5)
 async def fetch_weather(lat: float, lon: float) -> Dict[str, Any]:
     """Fetch weather information for coordinates.
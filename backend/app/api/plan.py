@@ -5,7 +5,7 @@ structured tourism planning response composed by the parent agent.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
@@ -19,6 +19,16 @@ from ..utils.logging_config import logger
 
 router = APIRouter(tags=["plan"])
 
+_KNOWN_INTENTS = frozenset({"weather", "places"})
+# Sorted intent list for every possible intent set, shared by orchestrate and
+# the response. An empty set (user ambiguous) defaults to both.
+_INTENT_ORDERS: Dict[FrozenSet[str], List[str]] = {
+    frozenset(): ["places", "weather"],
+    frozenset({"weather"}): ["weather"],
+    frozenset({"places"}): ["places"],
+    frozenset({"weather", "places"}): ["places", "weather"],
+}
+
 
 @router.options("/plan")
 async def plan_options():
@@ -99,16 +109,15 @@ async def plan(request: PlanRequest) -> PlanResponse:
         if not place_candidate:
             place_candidate = message
             logger.debug("Using entire message as place candidate", candidate=message)
-        
+
         if request.intents:
-            intent = {i for i in request.intents if i in {"weather", "places"}}
+            intent = _KNOWN_INTENTS.intersection(request.intents)
         else:
-            intent = detect_intent(message)
-        if not intent:
-            # Default to both if user ambiguous
-            intent = {"weather", "places"}
+            lowered = message.lower()
+            intent = detect_intent(lowered, already_lower=True)
+        sorted_intent = _INTENT_ORDERS[intent]
 
-        result: Dict[str, Any] = await orchestrate(place_candidate, sorted(intent))
+        result: Dict[str, Any] = await orchestrate(place_candidate, sorted_intent)
     except ValueError as exc:
         # User-facing errors (e.g., geocoding failures)
         logger.warning("User error during planning", error=str(exc))
@@ -122,23 +131,29 @@ async def plan(request: PlanRequest) -> PlanResponse:
         error_msg = "⚠️ Our travel planning service is temporarily unavailable. Please try again in a moment."
         raise HTTPException(status_code=500, detail=error_msg) from exc
 
+    # `result` is produced by our own agents, so build the models without
+    # validation. Note the response schema is then NOT enforced: FastAPI
+    # serializes these instances as-is (a wrong type only triggers a pydantic
+    # serializer warning), so the agents must keep emitting the declared
+    # types; tests/test_plan.py pins them.
     weather_block: Optional[WeatherPayload] = None
     if "weather" in result:
         wb = result.get("weather") or {}
-        weather_block = WeatherPayload(
+        forecast = wb.get("forecast")
+        weather_block = WeatherPayload.model_construct(
             temperature=wb.get("temperature"),
             precipitation_probability=wb.get("precipitation_probability"),
             summary=wb.get("summary"),
-            forecast=wb.get("forecast"),
+            forecast=list(forecast) if forecast else None,
             error=wb.get("error"),
         )
 
-    response = PlanResponse(
+    response = PlanResponse.model_construct(
         place=result.get("place"),
         lat=result.get("lat"),
         lon=result.get("lon"),
         geocode_source=result.get("geocode_source"),
-        intents=sorted(intent),
+        intents=sorted_intent,
         weather=weather_block,
         places=result.get("places"),
         places_geo=result.get("places_geo"),
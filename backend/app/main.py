@@ -6,12 +6,14 @@ and mounts the plan orchestration endpoint under /api.
 Environment variables (.env) supported:
 - USER_AGENT: String used for outbound requests to Nominatim/Overpass.
 - LOG_LEVEL: Logging level (default: INFO)
+- REDIS_URL: Optional Redis URL for rate limiting shared across workers.
 
 Run locally:
     uvicorn app.main:app --reload
 """
 from __future__ import annotations
 
+import asyncio
 import os
 from datetime import datetime, timezone
 from typing import Any, Dict
@@ -22,7 +24,13 @@ from dotenv import load_dotenv
 
 from .utils.logging_config import configure_logging, logger
 from .api.plan import router as plan_router
-from .middleware.rate_limit import RateLimitMiddleware
+from .middleware.rate_limit import (
+    RateLimitMiddleware,
+    close_redis_backend,
+    init_redis_backend,
+    prune_request_log_forever,
+)
+from .services.http import close_client
 
 # Load .env early
 load_dotenv()
@@ -66,8 +74,13 @@ async def health() -> Dict[str, Any]:
 @app.on_event("startup")
 async def on_startup() -> None:
     logger.info("Backend service starting")
+    app.state.rate_limit_pruner = asyncio.create_task(prune_request_log_forever())
+    await init_redis_backend()
 
 
 @app.on_event("shutdown")
 async def on_shutdown() -> None:
     logger.info("Backend service shutting down")
+    app.state.rate_limit_pruner.cancel()
+    await close_redis_backend()
+    await close_client()
@@ -1,61 +1,215 @@
-"""Simple in-memory rate limiter middleware.
+"""Rate limiter middleware.
 
-Prevents API abuse by limiting requests per IP address.
-Production should use Redis or similar distributed cache.
+Prevents API abuse by limiting requests per IP address. By default state is
+kept in-memory per process (sliding window). When REDIS_URL is set, a shared
+fixed-window counter in Redis is used instead so the limit holds across
+multiple workers; the in-memory window remains the fallback if Redis errors.
 """
 from __future__ import annotations
 
+import asyncio
+import os
 import time
-from collections import defaultdict
-from typing import Callable
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
 
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..utils.logging_config import logger
 
 # Configuration
 RATE_LIMIT_REQUESTS = 30  # requests
 RATE_LIMIT_WINDOW = 60    # seconds (1 minute)
+MAX_TRACKED_IPS = 100_000  # LRU bound on per-IP state
+# Seconds to wait on Redis before falling back to the in-memory window; an
+# unresponsive server must not stall every request.
+REDIS_TIMEOUT = 0.5
+
+# Atomically count a request in the current window bucket; the key expires
+# with the window so Redis holds O(1) state per active client.
+_INCR_EXPIRE_LUA = """
+local c = redis.call('INCR', KEYS[1])
+if c == 1 then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return c
+"""
+_redis: Any = None
+_redis_counter: Any = None
+
+
+@dataclass(slots=True)
+class _RequestWindow:
+    """Ring buffer of the most recent request timestamps for one client.
+
+    At most RATE_LIMIT_REQUESTS timestamps can ever be live, so they are kept
+    as unboxed doubles in a preallocated array; `head` is the next slot to
+    write and the `count` slots before it are the live (in-window) entries.
+    """
+    timestamps: array = field(default_factory=lambda: array("d", [0.0]) * RATE_LIMIT_REQUESTS)
+    head: int = 0
+    count: int = 0
+
+    def evict(self, now: float) -> None:
+        """Drop entries older than the window (each entry is dropped once)."""
+        while self.count and now - self.timestamps[(self.head - self.count) % RATE_LIMIT_REQUESTS] >= RATE_LIMIT_WINDOW:
+            self.count -= 1
+
+    def record(self, now: float) -> None:
+        self.timestamps[self.head] = now
+        self.head = (self.head + 1) % RATE_LIMIT_REQUESTS
+        self.count += 1
+
+
+# In-memory storage: {ip_address: _RequestWindow} with monotonic timestamps,
+# ordered least- to most-recently seen so the stalest client is evicted first.
+_request_log: OrderedDict[str, _RequestWindow] = OrderedDict()
+
+
+def _window_for(client_ip: str) -> _RequestWindow:
+    """Return the client's window, marking it most recently seen."""
+    window = _request_log.get(client_ip)
+    if window is None:
+        window = _request_log[client_ip] = _RequestWindow()
+        if len(_request_log) > MAX_TRACKED_IPS:
+            _request_log.popitem(last=False)
+    else:
+        _request_log.move_to_end(client_ip)
+    return window
+
+
+def prune_request_log() -> int:
+    """Drop clients with no requests left inside the window.
+
+    Returns:
+        Number of entries removed.
+    """
+    now = time.monotonic()
+    stale = []
+    for client_ip, window in _request_log.items():
+        window.evict(now)
+        if not window.count:
+            stale.append(client_ip)
+    for client_ip in stale:
+        del _request_log[client_ip]
+    return len(stale)
+
+
+async def prune_request_log_forever(interval: float = RATE_LIMIT_WINDOW) -> None:
+    """Background loop calling `prune_request_log` every `interval` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        prune_request_log()
+
+
+async def init_redis_backend(url: Optional[str] = None) -> None:
+    """Connect the shared Redis counter if a URL is configured.
 
-# In-memory storage: {ip_address: [(timestamp, ...), ...]}
-_request_log: dict[str, list[float]] = defaultdict(list)
+    REDIS_URL is read here, at startup, rather than at import so a value
+    from the .env file (loaded after this module is imported) is honoured.
+    """
+    global _redis, _redis_counter
+    url = url or os.getenv("REDIS_URL")
+    if not url:
+        return
+    import redis.asyncio as aioredis  # only needed when REDIS_URL is set
 
+    _redis = aioredis.from_url(url, socket_timeout=REDIS_TIMEOUT, socket_connect_timeout=REDIS_TIMEOUT)
+    _redis_counter = _redis.register_script(_INCR_EXPIRE_LUA)
+    logger.info("Rate limiting backed by Redis")
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using sliding window counter."""
 
-    async def dispatch(self, request: Request, call_next: Callable):
+async def close_redis_backend() -> None:
+    """Close the Redis connection (safe to call when it was never opened)."""
+    global _redis, _redis_counter
+    if _redis is not None:
+        await _redis.aclose()
+    _redis = _redis_counter = None
+
+
+def _consume_local(client_ip: str) -> Tuple[bool, int, int]:
+    """Count a request in the in-memory window.
+
+    Returns:
+        (allowed, remaining, reset epoch seconds).
+    """
+    current_time = time.monotonic()
+    window = _window_for(client_ip)
+
+    # Evict requests that fell out of the window
+    window.evict(current_time)
+
+    reset = int(time.time() + RATE_LIMIT_WINDOW)
+    if window.count >= RATE_LIMIT_REQUESTS:
+        return False, 0, reset
+    window.record(current_time)
+    return True, RATE_LIMIT_REQUESTS - window.count, reset
+
+
+async def _consume_redis(client_ip: str) -> Tuple[bool, int, int]:
+    """Count a request in the shared Redis fixed window (one round-trip)."""
+    bucket = int(time.time()) // RATE_LIMIT_WINDOW
+    count = int(await _redis_counter(keys=[f"rl:{client_ip}:{bucket}"], args=[RATE_LIMIT_WINDOW]))
+    reset = (bucket + 1) * RATE_LIMIT_WINDOW
+    return count <= RATE_LIMIT_REQUESTS, max(RATE_LIMIT_REQUESTS - count, 0), reset
+
+
+async def _consume(client_ip: str) -> Tuple[bool, int, int]:
+    if _redis_counter is not None:
+        try:
+            return await _consume_redis(client_ip)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Redis rate limit failed - using in-memory window", error=str(exc))
+    return _consume_local(client_ip)
+
+
+class RateLimitMiddleware:
+    """Rate limiting middleware.
+
+    Counts requests per client IP in an in-memory sliding window, or in a
+    fixed window per RATE_LIMIT_WINDOW when the shared Redis backend is
+    configured (a client can burst up to twice the limit across a window
+    boundary there).
+
+    Implemented as plain ASGI rather than BaseHTTPMiddleware, which wraps
+    every request in an extra task and memory stream to bridge the response.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Check rate limit before processing request."""
-        # Skip rate limiting for health endpoint and OPTIONS requests
-        if request.url.path == "/health" or request.method == "OPTIONS":
-            return await call_next(request)
-
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-        
-        # Clean old requests outside the window
-        _request_log[client_ip] = [
-            ts for ts in _request_log[client_ip]
-            if current_time - ts < RATE_LIMIT_WINDOW
-        ]
-        
+        # Skip rate limiting for non-HTTP traffic, health endpoint and OPTIONS requests
+        if scope["type"] != "http" or scope["path"] == "/health" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        allowed, remaining, reset = await _consume(client_ip)
+
         # Check if limit exceeded
-        if len(_request_log[client_ip]) >= RATE_LIMIT_REQUESTS:
-            raise HTTPException(
+        if not allowed:
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=f"Rate limit exceeded. Maximum {RATE_LIMIT_REQUESTS} requests per {RATE_LIMIT_WINDOW} seconds.",
-                headers={"Retry-After": str(RATE_LIMIT_WINDOW)}
+                content={"detail": f"Rate limit exceeded. Maximum {RATE_LIMIT_REQUESTS} requests per {RATE_LIMIT_WINDOW} seconds."},
+                headers={"Retry-After": str(RATE_LIMIT_WINDOW)},
             )
-        
-        # Log this request
-        _request_log[client_ip].append(current_time)
-        
+            await response(scope, receive, send)
+            return
+
+        async def send_with_limit_headers(message: Message) -> None:
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(RATE_LIMIT_REQUESTS)
+                headers["X-RateLimit-Remaining"] = str(remaining)
+                headers["X-RateLimit-Reset"] = str(reset)
+            await send(message)
+
         # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        remaining = RATE_LIMIT_REQUESTS - len(_request_log[client_ip])
-        response.headers["X-RateLimit-Limit"] = str(RATE_LIMIT_REQUESTS)
-        response.headers["X-RateLimit-Remaining"] = str(remaining)
-        response.headers["X-RateLimit-Reset"] = str(int(current_time + RATE_LIMIT_WINDOW))
-        
-        return response
+        await self.app(scope, receive, send_with_limit_headers)
@@ -16,21 +16,24 @@ from dataclasses import dataclass
 from typing import List, Optional
 import asyncio
 import os
+import random
 import time
 
-import httpx
-
+from .http import get_client
 from ..utils.logging_config import logger
 
 # Attempt to import TTL cache decorator (will be created later).
 try:  # pragma: no cover - fallback path
-    from ..utils.cache import ttl_cache
+    from ..utils.cache import coalesce_call, ttl_cache
 except Exception:  # noqa: BLE001
     def ttl_cache(ttl_seconds: int = 300):  # type: ignore
         def decorator(func):
             return func
         return decorator
 
+    async def coalesce_call(inflight, key, start):  # type: ignore
+        return await start()
+
 
 NOMINATIM_URL = "https://nominatim.openstreetmap.org/search"
 # Provide a more descriptive (and policy-compliant) user agent with contact.
@@ -38,11 +41,39 @@ DEFAULT_USER_AGENT = os.getenv(
     "USER_AGENT",
     "tourism-orchestrator/1.0 (+https://example.com/contact)"
 )
+# Upper bound (seconds) on honouring a 429 Retry-After inside a user request.
+MAX_RETRY_AFTER = 5.0
+
+
+def _static_first() -> bool:
+    """Whether to answer well-known cities from the static table before Nominatim.
+
+    Read per call (GEOCODE_STATIC_FIRST, default on) rather than at import,
+    since this module is imported before main.py loads the .env file.
+    """
+    return os.getenv("GEOCODE_STATIC_FIRST", "1") == "1"
+
+
+@dataclass(slots=True)
+class GeocodeResult:
+    """Structured geocode result with origin source."""
+    display_name: str
+    lat: float
+    lon: float
+    source: str = "nominatim"
+
+    def as_dict(self) -> dict:
+        return {"display_name": self.display_name, "lat": self.lat, "lon": self.lon}
+
 
 # Simple local fallback cache (key -> (expiry, value)) if decorator not in use.
-_fallback_cache: dict[str, tuple[float, List["GeocodeResult"]]] = {}
+_fallback_cache: dict[str, tuple[float, List[GeocodeResult]]] = {}
 _FALLBACK_TTL = 300.0
 
+# In-flight Nominatim lookups (normalized query -> [task, waiter count]) so
+# concurrent callers asking for the same place share one upstream request.
+_inflight: dict[str, list] = {}
+
 # Alias mappings for legacy / alternate place names (lowercase -> list of variant queries)
 ALIAS_MAP: dict[str, List[str]] = {
     "bangalore": ["bengaluru", "bengaluru, india"],
@@ -59,38 +90,35 @@ ALIAS_MAP: dict[str, List[str]] = {
     "goa": ["goa, india"],
 }
 
-# Static coordinate fallback (for offline / blocked geocoding scenarios). We store
-# tuples first because GeocodeResult is defined later; we convert lazily.
-STATIC_FALLBACK_RAW: dict[str, tuple[str, float, float]] = {
-    "bengaluru": ("Bengaluru, India", 12.9716, 77.5946),
-    "bangalore": ("Bengaluru, India", 12.9716, 77.5946),
-    "goa": ("Goa, India", 15.2993, 74.1240),
-    "mumbai": ("Mumbai, India", 19.0760, 72.8777),
-    "delhi": ("Delhi, India", 28.6139, 77.2090),
-    "paris": ("Paris, France", 48.8566, 2.3522),
-    "london": ("London, United Kingdom", 51.5072, -0.1276),
-    "tokyo": ("Tokyo, Japan", 35.6762, 139.6503),
-    "new york": ("New York City, USA", 40.7128, -74.0060),
+# Static coordinate fallback (for offline / blocked geocoding scenarios), built
+# once at import so lookups hand back ready-made (shared, read-only) results.
+STATIC_FALLBACK: dict[str, GeocodeResult] = {
+    key: GeocodeResult(display_name=name, lat=lat, lon=lon, source="static")
+    for key, (name, lat, lon) in {
+        "bengaluru": ("Bengaluru, India", 12.9716, 77.5946),
+        "bangalore": ("Bengaluru, India", 12.9716, 77.5946),
+        "goa": ("Goa, India", 15.2993, 74.1240),
+        "mumbai": ("Mumbai, India", 19.0760, 72.8777),
+        "delhi": ("Delhi, India", 28.6139, 77.2090),
+        "paris": ("Paris, France", 48.8566, 2.3522),
+        "london": ("London, United Kingdom", 51.5072, -0.1276),
+        "tokyo": ("Tokyo, Japan", 35.6762, 139.6503),
+        "new york": ("New York City, USA", 40.7128, -74.0060),
+    }.items()
 }
 
-def _static_result(key: str) -> Optional["GeocodeResult"]:
-    raw = STATIC_FALLBACK_RAW.get(key)
-    if not raw:
-        return None
-    name, lat, lon = raw
-    return GeocodeResult(display_name=name, lat=lat, lon=lon, source="static")
 
+def _static_result(key: str) -> Optional[GeocodeResult]:
+    return STATIC_FALLBACK.get(key)
 
-@dataclass(slots=True)
-class GeocodeResult:
-    """Structured geocode result with origin source."""
-    display_name: str
-    lat: float
-    lon: float
-    source: str = "nominatim"
 
-    def as_dict(self) -> dict:
-        return {"display_name": self.display_name, "lat": self.lat, "lon": self.lon}
+def _static_lookup(key: str) -> Optional[GeocodeResult]:
+    """Static result for key or, failing that, for one of its aliases."""
+    for candidate in (key, *ALIAS_MAP.get(key, ())):
+        static = _static_result(candidate)
+        if static:
+            return static
+    return None
 
 
 async def _perform_request(query: str) -> List[GeocodeResult]:
@@ -120,22 +148,29 @@ async def _perform_request(query: str) -> List[GeocodeResult]:
     backoff = 0.5
     data = None
     last_exc: Optional[Exception] = None
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        for attempt in range(1, attempts + 1):
-            try:
-                resp = await client.get(NOMINATIM_URL, params=params, headers=headers)
-                if resp.status_code == 429:
-                    raise ValueError("Rate limited by geocoding provider")
-                resp.raise_for_status()
-                data = resp.json()
-                logger.info("Geocode response received", status=resp.status_code, attempt=attempt)
-                break
-            except Exception as exc:
-                last_exc = exc
-                logger.warning("Geocode attempt failed", query=query, attempt=attempt, error=str(exc))
-                if attempt < attempts:
-                    await asyncio.sleep(backoff)
-                    backoff *= 2
+    client = get_client()
+    for attempt in range(1, attempts + 1):
+        retry_after: Optional[float] = None
+        try:
+            resp = await client.get(NOMINATIM_URL, params=params, headers=headers, timeout=10.0)
+            if resp.status_code == 429:
+                try:
+                    retry_after = min(float(resp.headers["Retry-After"]), MAX_RETRY_AFTER)
+                except (KeyError, ValueError):
+                    pass
+                raise ValueError("Rate limited by geocoding provider")
+            resp.raise_for_status()
+            data = resp.json()
+            logger.info("Geocode response received", status=resp.status_code, attempt=attempt)
+            break
+        except Exception as exc:
+            last_exc = exc
+            logger.warning("Geocode attempt failed", query=query, attempt=attempt, error=str(exc))
+            if attempt < attempts:
+                # Jitter so concurrent clients don't retry in lock-step
+                delay = retry_after if retry_after is not None else random.uniform(backoff * 0.5, backoff * 1.5)
+                await asyncio.sleep(delay)
+                backoff *= 2
     if data is None:
         raise ValueError(f"Geocoding service error: {last_exc}")
 
@@ -168,10 +203,24 @@ async def _perform_request(query: str) -> List[GeocodeResult]:
     return results
 
 
+async def _coalesced_request(query: str) -> List[GeocodeResult]:
+    """Run `_perform_request`, sharing a single in-flight call per query.
+
+    Keyed on the normalized query, so "Venice" and "venice " (and alias
+    variants tried by concurrent lookups) share one Nominatim call, which
+    ttl_cache's per-argument coalescing alone would not. One caller being
+    cancelled does not cancel the lookup for the others; it is cancelled once
+    the last waiter goes away.
+    """
+    return await coalesce_call(_inflight, query.strip().lower(), lambda: _perform_request(query))
+
+
 @ttl_cache(ttl_seconds=300)
 async def geocode_place(query: str) -> List[GeocodeResult]:
     """Public geocode function with TTL caching.
 
+    Places present in the static table (directly or via an alias) are answered
+    locally without a network round-trip unless GEOCODE_STATIC_FIRST=0.
     If caching decorator not available yet, fallback to minimal internal cache.
 
     Args:
@@ -183,20 +232,26 @@ async def geocode_place(query: str) -> List[GeocodeResult]:
     if not key:
         raise ValueError("Empty geocode query")
 
+    if _static_first():
+        static = _static_lookup(key)
+        if static:
+            logger.debug("Geocode static hit", query=query)
+            return [static]
+
     # Fallback manual cache path (only used if decorator stubbed)
     if ttl_cache.__name__ == "geocode_place":  # type: ignore[attr-defined]
-        now = time.time()
+        now = time.monotonic()
         cached = _fallback_cache.get(key)
         if cached and cached[0] > now:
             logger.debug("Geocode fallback cache hit", query=query)
             return cached[1]
-        results = await _perform_request(query)
+        results = await _coalesced_request(query)
         _fallback_cache[key] = (now + _FALLBACK_TTL, results)
         return results
 
     # Normal path (decorator will have cached if previously called)
     try:
-        return await _perform_request(query)
+        return await _coalesced_request(query)
     except ValueError as original_err:
         aliases = ALIAS_MAP.get(key, [])
         if not aliases:
@@ -208,7 +263,7 @@ async def geocode_place(query: str) -> List[GeocodeResult]:
         logger.info("Geocode alias fallback", original=query, variants=aliases)
         for variant in aliases:
             try:
-                results = await _perform_request(variant)
+                results = await _coalesced_request(variant)
                 if results:
                     return results
             except ValueError:
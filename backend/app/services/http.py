@@ -0,0 +1,49 @@
+"""Shared outbound HTTP client.
+
+A single long-lived `httpx.AsyncClient` is reused by the service helpers
+(Nominatim, Open-Meteo, Overpass) so repeated calls to the same upstream keep
+their TCP/TLS connections alive instead of paying a fresh handshake per
+request. The client is created lazily on first use and closed from the
+FastAPI shutdown hook; per-endpoint timeouts are passed on each request.
+
+HTTP/2 is negotiated when the optional `h2` package is installed (via
+`httpx[http2]`), so concurrent weather / places / geocode calls to the same
+host multiplex over one connection. The transport also retries failed
+connection attempts once.
+"""
+from __future__ import annotations
+
+from typing import Optional
+
+import httpx
+
+try:  # pragma: no cover - depends on optional extra
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:  # pragma: no cover
+    HTTP2_ENABLED = False
+
+DEFAULT_TIMEOUT = 10.0
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0)
+CONNECT_RETRIES = 1
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first call."""
+    global _client
+    if _client is None or _client.is_closed:
+        transport = httpx.AsyncHTTPTransport(
+            http2=HTTP2_ENABLED, limits=POOL_LIMITS, retries=CONNECT_RETRIES
+        )
+        _client = httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, transport=transport)
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client (safe to call when it was never created)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -11,14 +11,27 @@ request construction and parsing only.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
-import httpx
+from bisect import bisect_left
+from itertools import islice, zip_longest
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
+
+from .http import get_client
 from ..utils.logging_config import logger
 
 OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 DEFAULT_TIMEZONE = "Asia/Kolkata"
 
+# Fixed query parameters, kept as (key, value) pairs so each request only adds
+# the coordinates and timezone around them.
+_BASE_PARAMS: Tuple[Tuple[str, Any], ...] = (
+    ("current_weather", "true"),
+    ("hourly", "precipitation_probability"),
+    ("daily", "temperature_2m_max,temperature_2m_min,precipitation_probability_max,weathercode"),
+    ("forecast_days", 7),
+)
+
 # Mapping from Open-Meteo weather codes to simple summaries.
 # Reference: https://open-meteo.com/en/docs#weathervariables
 WEATHER_CODE_MAP: Dict[int, str] = {
@@ -52,6 +65,15 @@ WEATHER_CODE_MAP: Dict[int, str] = {
     99: "Thunderstorm With Heavy Hail",
 }
 
+# WMO codes are small ints (0-99); index a dense tuple on the hot path instead
+# of hashing into the map. WEATHER_CODE_MAP remains the source of truth.
+_WEATHER_CODE_TABLE: Tuple[Optional[str], ...] = tuple(WEATHER_CODE_MAP.get(i) for i in range(100))
+
+
+def _code_summary(code: int) -> Optional[str]:
+    """Summary for a weathercode, or None if it is not mapped."""
+    return _WEATHER_CODE_TABLE[code] if 0 <= code < len(_WEATHER_CODE_TABLE) else None
+
 
 def _extract_precip_probability(data: Dict[str, Any]) -> Optional[int]:
     """Match current hour's precipitation probability.
@@ -60,6 +82,8 @@ def _extract_precip_probability(data: Dict[str, Any]) -> Optional[int]:
     `hourly.time` and `hourly.precipitation_probability`.
 
     We find the index in `hourly.time` that exactly matches `current_weather.time`.
+    The hourly timestamps are ascending ISO strings, so a binary search locates
+    the hour in O(log N) without building a lookup table for a single probe.
     If match found and precipitation probability present, return int value.
 
     Args:
@@ -74,16 +98,20 @@ def _extract_precip_probability(data: Dict[str, Any]) -> Optional[int]:
     except (KeyError, TypeError):
         return None
 
-    if not (isinstance(times, list) and isinstance(probs, list)):
+    if not (isinstance(current_time, str) and isinstance(times, list) and isinstance(probs, list)):
         return None
 
     try:
-        idx = times.index(current_time)
-    except ValueError:
+        idx = bisect_left(times, current_time)
+    except TypeError:
+        # Non-string entries (e.g. null) in hourly.time are not comparable
+        logger.debug("Unorderable hourly time array", current_time=current_time)
+        return None
+    if idx >= len(times) or times[idx] != current_time:
         logger.debug("Current time not found in hourly time array", current_time=current_time)
         return None
 
-    if idx < 0 or idx >= len(probs):
+    if idx >= len(probs):
         return None
     val = probs[idx]
     if val is None:
@@ -100,7 +128,17 @@ def _weather_summary(data: Dict[str, Any]) -> Optional[str]:
         code = int(data["current_weather"]["weathercode"])
     except (KeyError, TypeError, ValueError):
         return None
-    return WEATHER_CODE_MAP.get(code)
+    return _code_summary(code)
+
+
+def _forecast_summary(code: Any) -> Optional[str]:
+    """Summary for a daily weathercode; "Unknown" for unmapped codes."""
+    if code is None:
+        return None
+    try:
+        return _code_summary(int(code)) or "Unknown"
+    except (TypeError, ValueError):
+        return "Unknown"
 
 
 async def fetch_open_meteo(lat: float, lon: float, timezone: str = DEFAULT_TIMEZONE) -> Dict[str, Any]:
@@ -116,21 +154,12 @@ async def fetch_open_meteo(lat: float, lon: float, timezone: str = DEFAULT_TIMEZ
     Raises:
         httpx.HTTPError for network / protocol issues.
     """
-    params = {
-        "latitude": lat,
-        "longitude": lon,
-        "current_weather": "true",
-        "hourly": "precipitation_probability",
-        "daily": "temperature_2m_max,temperature_2m_min,precipitation_probability_max,weathercode",
-        "forecast_days": 7,
-        "timezone": timezone,
-    }
+    params = (("latitude", lat), ("longitude", lon), *_BASE_PARAMS, ("timezone", timezone))
 
     logger.debug("Open-Meteo request", lat=lat, lon=lon, timezone=timezone)
-    async with httpx.AsyncClient(timeout=10.0) as client:
-        resp = await client.get(OPEN_METEO_URL, params=params)
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await get_client().get(OPEN_METEO_URL, params=params, timeout=10.0)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
 
     temperature: Optional[float] = None
     try:
@@ -141,26 +170,27 @@ async def fetch_open_meteo(lat: float, lon: float, timezone: str = DEFAULT_TIMEZ
     precipitation_probability = _extract_precip_probability(data)
     summary = _weather_summary(data)
     
-    # Extract 7-day forecast
-    forecast = []
-    try:
-        daily_data = data.get("daily", {})
-        times = daily_data.get("time", [])
-        max_temps = daily_data.get("temperature_2m_max", [])
-        min_temps = daily_data.get("temperature_2m_min", [])
-        precip_probs = daily_data.get("precipitation_probability_max", [])
-        weather_codes = daily_data.get("weathercode", [])
-        
-        for i in range(min(7, len(times))):
-            forecast.append({
-                "date": times[i],
-                "temp_max": max_temps[i] if i < len(max_temps) else None,
-                "temp_min": min_temps[i] if i < len(min_temps) else None,
-                "precipitation_probability": precip_probs[i] if i < len(precip_probs) else None,
-                "summary": WEATHER_CODE_MAP.get(int(weather_codes[i]), "Unknown") if i < len(weather_codes) and weather_codes[i] is not None else None,
-            })
-    except Exception as exc:
-        logger.debug("Forecast extraction failed", error=str(exc))
+    # Extract 7-day forecast. `time` drives the day count; shorter parallel
+    # arrays are padded with None by zip_longest.
+    daily_data = data.get("daily") or {}
+    times = daily_data.get("time") or []
+    rows = zip_longest(
+        times,
+        daily_data.get("temperature_2m_max") or [],
+        daily_data.get("temperature_2m_min") or [],
+        daily_data.get("precipitation_probability_max") or [],
+        daily_data.get("weathercode") or [],
+    )
+    forecast = [
+        {
+            "date": date,
+            "temp_max": temp_max,
+            "temp_min": temp_min,
+            "precipitation_probability": precip,
+            "summary": _forecast_summary(code),
+        }
+        for date, temp_max, temp_min, precip, code in islice(rows, min(7, len(times)))
+    ]
 
     result = {
         "temperature": temperature,
@@ -168,5 +198,10 @@ async def fetch_open_meteo(lat: float, lon: float, timezone: str = DEFAULT_TIMEZ
         "summary": summary,
         "forecast": forecast if forecast else None,
     }
-    logger.debug("Open-Meteo parsed", **{k: v for k, v in result.items() if k != 'forecast'})
+    logger.debug(
+        "Open-Meteo parsed",
+        temperature=temperature,
+        precipitation_probability=precipitation_probability,
+        summary=summary,
+    )
     return result
@@ -4,13 +4,24 @@ Provides async query functionality to fetch tourist-related POIs near a
 coordinate. We focus on priority tags: tourism=attraction, leisure=park,
 historic=* while filtering unnamed nodes.
 
+Responses are parsed lazily with ijson: elements are decoded one at a time
+and parsing stops as soon as enough POIs are collected, so large responses
+never materialize as a full JSON tree. `fetch_pois` feeds the response stream
+straight into the parser and closes it once the limit is reached. This relies
+on ijson's compiled yajl2_c backend; if only the pure-Python backend is
+available, the body is decoded in one go with orjson instead, which is still
+far faster than interpreting the token stream element by element.
+
 Documentation: https://wiki.openstreetmap.org/wiki/Overpass_API
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-import httpx
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple, Union
+
+import ijson
+import orjson
 
+from .http import get_client
 from ..utils.logging_config import logger
 
 OVERPASS_URL = "https://overpass-api.de/api/interpreter"
@@ -22,6 +33,20 @@ PRIORITY_FILTERS = [
     "nwr[historic]",
 ]
 
+# Lazy element streaming only pays off with ijson's C backend.
+_STREAM_ELEMENTS = ijson.backend == "yajl2_c"
+if not _STREAM_ELEMENTS:  # pragma: no cover - depends on installed wheels
+    logger.warning("ijson C backend unavailable - decoding Overpass with orjson", backend=ijson.backend)
+
+# Tag keys used to categorize a POI, in priority order.
+_CATEGORY_KEYS = ("tourism", "leisure", "historic")
+
+
+# Query template with the union clauses pre-joined at import; only the
+# radius and coordinates are substituted per call.
+_UNION_TEMPLATE = "\n      ".join(f"{f}(around:{{radius}},{{lat}},{{lon}});" for f in PRIORITY_FILTERS)
+_QUERY_TEMPLATE = f"[out:json][timeout:25];\n(\n      {_UNION_TEMPLATE}\n);\nout center;"
+
 
 def build_overpass_query(lat: float, lon: float, radius: int) -> str:
         """Construct a valid Overpass QL query string.
@@ -30,99 +55,128 @@ def build_overpass_query(lat: float, lon: float, radius: int) -> str:
         (around:..) clause resulting in invalid syntax. Correct form repeats
         the (around) for each clause inside the union.
         """
-        lines = [
-                f"{f}(around:{radius},{lat},{lon});" for f in PRIORITY_FILTERS
-        ]
-        union_block = "\n      ".join(lines)
-        query = f"""
-        [out:json][timeout:25];
-        (
-            {union_block}
-        );
-        out center;
-        """.strip()
+        query = _QUERY_TEMPLATE.format(radius=radius, lat=lat, lon=lon)
         logger.debug("Overpass query built", radius=radius, lat=lat, lon=lon)
         return query
 
 
-async def execute_overpass(query: str) -> Dict[str, Any]:
-    """Execute Overpass POST request and return parsed JSON.
+_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+_TIMEOUT = 30.0
 
-    Raises httpx.HTTPError for network-level issues.
-    """
-    headers = {"Content-Type": "application/x-www-form-urlencoded"}
-    data = {"data": query}
-    logger.debug("Overpass request dispatch")
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        resp = await client.post(OVERPASS_URL, data=data, headers=headers)
-        resp.raise_for_status()
-        return resp.json()
 
+def _coords(el: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    """Extract coordinates (node: lat/lon; way/relation: center), or (None, None)."""
+    src = el if "lat" in el and "lon" in el else el.get("center")
+    try:
+        return float(src["lat"]), float(src["lon"])
+    except (KeyError, TypeError, ValueError):
+        return None, None
 
-def parse_overpass_elements(data: Dict[str, Any], limit: int) -> List[Dict[str, Any]]:
+
+def _add_element(results: Dict[str, Dict[str, Any]], el: Dict[str, Any]) -> None:
+    """Add one Overpass element to results (keyed by name) if it is a new named POI."""
+    tags: Optional[Dict[str, Any]] = el.get("tags")
+    if not tags:
+        return
+    # name precedence: name, name:en
+    name = tags.get("name") or tags.get("name:en")
+    if not name:
+        return
+    if name in results:
+        return
+
+    category = None
+    for key in _CATEGORY_KEYS:
+        if key in tags:
+            category = f"{key}:{tags[key]}"
+            break
+
+    lat_val, lon_val = _coords(el)
+    results[name] = {"name": name, "category": category, "lat": lat_val, "lon": lon_val}
+
+
+def parse_overpass_elements(data: Union[bytes, Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
     """Parse Overpass JSON elements extracting name + category.
 
     Args:
-        data: Raw JSON dict.
+        data: Raw JSON body (streamed element by element) or an already
+            decoded JSON dict.
         limit: Maximum number of POIs to return.
     Returns:
         List of dicts with 'name' and 'category'.
     """
-    elements = data.get("elements", [])
-    results: List[Dict[str, Any]] = []
-    seen_names: set[str] = set()
+    elements: Iterable[Dict[str, Any]]
+    if isinstance(data, (bytes, bytearray)):
+        if _STREAM_ELEMENTS:
+            elements = ijson.items(data, "elements.item", use_float=True)
+        else:
+            elements = orjson.loads(data).get("elements", [])
+    else:
+        elements = data.get("elements", [])
+    # Keyed by name: dedupes and keeps insertion order in one structure.
+    results: Dict[str, Dict[str, Any]] = {}
 
     for el in elements:
-        tags: Optional[Dict[str, Any]] = el.get("tags")
-        if not tags:
-            continue
-        # name precedence: name, name:en
-        name = tags.get("name") or tags.get("name:en")
-        if not name:
-            continue
-        if name in seen_names:
-            continue
-        seen_names.add(name)
-
-        category = None
-        for key in ("tourism", "leisure", "historic"):
-            if key in tags:
-                category = f"{key}:{tags[key]}"
-                break
-
-        # Extract coordinates (node: lat/lon; way/relation: center)
-        lat_val: Optional[float] = None
-        lon_val: Optional[float] = None
-        if "lat" in el and "lon" in el:
-            try:
-                lat_val = float(el["lat"])
-                lon_val = float(el["lon"])
-            except (TypeError, ValueError):
-                lat_val = None
-                lon_val = None
-        elif "center" in el and isinstance(el.get("center"), dict):
-            c = el["center"]
-            try:
-                lat_val = float(c.get("lat"))
-                lon_val = float(c.get("lon"))
-            except (TypeError, ValueError):
-                lat_val = None
-                lon_val = None
-
-        results.append({"name": name, "category": category, "lat": lat_val, "lon": lon_val})
+        _add_element(results, el)
         if len(results) >= limit:
             break
 
     logger.debug("Overpass parsed", count=len(results))
-    return results
+    return list(results.values())
+
+
+class _AsyncChunkReader:
+    """Minimal async file-like adapter over an async byte-chunk iterator.
+
+    ijson's async parsers only need `await read(n)`; chunks are handed over as
+    they arrive (sizes may differ from n) and b"" signals end of stream.
+    ijson probes with read(0) to detect bytes vs str, which must not consume.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes]) -> None:
+        self._chunks = chunks
+
+    async def read(self, n: int = -1) -> bytes:
+        if n == 0:
+            return b""
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+async def _stream_overpass_pois(query: str, limit: int) -> List[Dict[str, Any]]:
+    """POST the query and parse POIs straight off the response stream.
+
+    Elements are decoded as bytes arrive, and the response is closed as soon
+    as `limit` POIs are collected, so the body is never buffered in full.
+
+    Raises httpx.HTTPError for network-level issues.
+    """
+    logger.debug("Overpass request dispatch", streaming=True)
+    async with get_client().stream(
+        "POST", OVERPASS_URL, data={"data": query}, headers=_HEADERS, timeout=_TIMEOUT
+    ) as resp:
+        resp.raise_for_status()
+        if not _STREAM_ELEMENTS:
+            return parse_overpass_elements(await resp.aread(), limit)
+
+        results: Dict[str, Dict[str, Any]] = {}
+        reader = _AsyncChunkReader(resp.aiter_bytes())
+        async for el in ijson.items_async(reader, "elements.item", use_float=True):
+            _add_element(results, el)
+            if len(results) >= limit:
+                break
+
+    logger.debug("Overpass parsed", count=len(results))
+    return list(results.values())
 
 
 async def fetch_pois(lat: float, lon: float, radius: int, limit: int = 5) -> List[Dict[str, Any]]:
     """High-level convenience function to fetch POIs.
 
     If fewer than limit results are found, the caller may decide to expand radius
-    and retry (handled by places agent).
+    (the places agent queries expanded radii concurrently with the initial one).
     """
     query = build_overpass_query(lat, lon, radius)
-    data = await execute_overpass(query)
-    return parse_overpass_elements(data, limit=limit)
+    return await _stream_overpass_pois(query, limit)
@@ -1,62 +1,121 @@
 """Simple TTL caching utilities.
 
 Provides a lightweight async-capable decorator `ttl_cache` storing results
-in-memory keyed by function name + arguments. Not thread-safe but adequate
-for demo usage to reduce external API calls.
+in-memory keyed by function name + arguments. Each decorated function gets its
+own bounded `cachetools.TTLCache`, so expired entries are evicted and memory
+stays capped. Concurrent async misses for the same key share one in-flight
+call instead of each hitting the upstream API; the shared call is cancelled
+once every caller waiting on it has been cancelled (see `coalesce_call`). Not
+thread-safe but adequate for demo usage to reduce external API calls.
 """
 from __future__ import annotations
 
-from functools import wraps
-from typing import Any, Awaitable, Callable, Dict, Tuple
+import asyncio
 import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+from cachetools import TTLCache
 
-CacheKey = Tuple[str, Tuple[Any, ...], Tuple[Tuple[str, Any], ...]]
+CacheKey = Tuple[Any, ...]
 
-_store: Dict[CacheKey, Tuple[float, Any]] = {}
+DEFAULT_MAXSIZE = 1024
 
 
 def _make_key(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> CacheKey:
-    kw_items = tuple(sorted(kwargs.items()))
-    return (func.__qualname__, args, kw_items)
+    # Wrapped services are almost always called positionally; skip building
+    # a kwargs component then. The frozenset is order-independent without
+    # sorting, and the differing tuple length keeps the two shapes distinct.
+    if not kwargs:
+        return (func.__qualname__, args)
+    return (func.__qualname__, args, frozenset(kwargs.items()))
+
+
+def _forget(inflight: Dict[Hashable, List[Any]], key: Hashable, entry: List[Any]) -> None:
+    # Only drop the entry if it was not already replaced by a new call.
+    if inflight.get(key) is entry:
+        del inflight[key]
+
+
+async def coalesce_call(
+    inflight: Dict[Hashable, List[Any]],
+    key: Hashable,
+    start: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Await a call shared by all concurrent callers using the same key.
+
+    The first caller starts `start()` as a task recorded in `inflight` as
+    [task, waiter count]; later callers await the same task. Waiters are
+    shielded, so one caller being cancelled does not cancel the call for the
+    others, but the task is cancelled (and forgotten) once its last waiter
+    goes away, so abandoned upstream requests do not keep running.
+
+    Args:
+        inflight: Per-call-site map of in-flight entries.
+        key: Hashable identity of the call.
+        start: Zero-argument factory returning the coroutine to run.
+    Returns:
+        The shared call's result.
+    """
+    entry = inflight.get(key)
+    if entry is None:
+        task = asyncio.ensure_future(start())
+        entry = inflight[key] = [task, 0]
+        task.add_done_callback(lambda _: _forget(inflight, key, entry))
+    task = entry[0]
+    entry[1] += 1
+    try:
+        return await asyncio.shield(task)
+    finally:
+        entry[1] -= 1
+        if entry[1] == 0 and not task.done():
+            _forget(inflight, key, entry)
+            task.cancel()
 
 
-def ttl_cache(ttl_seconds: int = 300) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+def ttl_cache(ttl_seconds: int = 300, maxsize: int = DEFAULT_MAXSIZE) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """Cache decorator supporting sync or async callables.
 
     Args:
         ttl_seconds: Time-to-live for cached entries.
+        maxsize: Maximum number of entries kept for the decorated function.
     Returns:
         Wrapped callable using in-memory TTL cache.
     """
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        # Monotonic clock: cheap to read and immune to wall-clock adjustments.
+        cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl_seconds, timer=time.monotonic)
+        inflight: Dict[Hashable, List[Any]] = {}
+
+        async def _call_and_store(key: CacheKey, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+            result = await func(*args, **kwargs)
+            cache[key] = result
+            return result
+
         @wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
             key = _make_key(func, args, kwargs)
-            now = time.time()
-            entry = _store.get(key)
-            if entry and entry[0] > now:
+            try:
                 # Return cached result (not coroutine)
-                return entry[1]
-            # Execute async function and cache the result
-            result = await func(*args, **kwargs)
-            _store[key] = (now + ttl_seconds, result)
-            return result
+                return cache[key]
+            except KeyError:
+                pass
+            # Execute async function and cache the result; concurrent callers
+            # with the same key await the same call.
+            return await coalesce_call(inflight, key, lambda: _call_and_store(key, args, kwargs))
 
         @wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
             key = _make_key(func, args, kwargs)
-            now = time.time()
-            entry = _store.get(key)
-            if entry and entry[0] > now:
-                return entry[1]
+            try:
+                return cache[key]
+            except KeyError:
+                pass
             result = func(*args, **kwargs)
-            _store[key] = (now + ttl_seconds, result)
+            cache[key] = result
             return result
 
         # Detect async function properly using asyncio.iscoroutinefunction
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        return sync_wrapper
+        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
 
     return decorator
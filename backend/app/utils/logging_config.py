@@ -5,9 +5,10 @@ JSON-like structured logs suitable for cloud deployment debugging.
 """
 from __future__ import annotations
 
-import json
 import sys
 from typing import Any, Dict
+
+import orjson
 from loguru import logger as _logger
 
 
@@ -24,13 +25,19 @@ def _serialize(record: Dict[str, Any]) -> str:
         base.update(record["extra"])  # type: ignore[arg-type]
     if record.get("exception"):
         base["exception"] = str(record["exception"])
-    return json.dumps(base, ensure_ascii=False)
+    # orjson emits UTF-8 directly (no ensure_ascii escaping needed). The time
+    # stays pre-formatted: loguru hands us a datetime subclass, which orjson
+    # refuses to serialize natively.
+    return orjson.dumps(base).decode("utf-8")
 
 
 def configure_logging(level: str = "INFO") -> None:
     """Configure global logger sink and level."""
     _logger.remove()
-    _logger.add(sys.stderr, level=level.upper(), format="{message}", enqueue=True, serialize=False, backtrace=False, diagnose=False, filter=None)
+    # Written synchronously: each worker process owns its stderr, so the
+    # enqueue=True queue only added a pickle + thread hand-off per record.
+    # Records below `level` are dropped by loguru before the patcher runs.
+    _logger.add(sys.stderr, level=level.upper(), format="{message}", enqueue=False, serialize=False, backtrace=False, diagnose=False, filter=None)
     # Wrap to produce JSON lines
     def patching(record):  # type: ignore[override]
         record["message"] = _serialize(record)
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+import random
 from functools import wraps
 from typing import Any, Callable, Type
 
@@ -13,7 +14,9 @@ def async_retry(retries: int = 3, backoff_factor: float = 0.5, exceptions: tuple
 
     Args:
         retries: Number of attempts (total including first).
-        backoff_factor: Base multiplier for exponential backoff.
+        backoff_factor: Base multiplier for exponential backoff. Each wait is
+            drawn uniformly from [0, backoff_factor * 2**n] ("full jitter") so
+            callers failing together do not retry in lockstep.
         exceptions: Tuple of exception types to catch.
     Returns:
         Wrapped coroutine function with retry logic.
@@ -21,6 +24,8 @@ def async_retry(retries: int = 3, backoff_factor: float = 0.5, exceptions: tuple
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         if not asyncio.iscoroutinefunction(func):  # pragma: no cover
             raise TypeError("async_retry requires an async function")
+        # Backoff ceilings are fixed per decorated function; compute them once.
+        schedule = tuple(backoff_factor * (2 ** i) for i in range(max(retries - 1, 0)))
 
         @wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -34,8 +39,7 @@ def async_retry(retries: int = 3, backoff_factor: float = 0.5, exceptions: tuple
                     attempt += 1
                     if attempt >= retries:
                         raise
-                    sleep_for = backoff_factor * (2 ** (attempt - 1))
-                    await asyncio.sleep(sleep_for)
+                    await asyncio.sleep(random.uniform(0, schedule[attempt - 1]))
             if last_exc:
                 raise last_exc
 
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.utils.cache import ttl_cache
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_coalesces_concurrent_misses():
+    calls = 0
+
+    @ttl_cache(ttl_seconds=60)
+    async def slow_lookup(key: str) -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    results = await asyncio.gather(*(slow_lookup("kyoto") for _ in range(5)))
+    assert results == ["KYOTO"] * 5
+    assert calls == 1
+
+    # Subsequent call is served from the cache
+    assert await slow_lookup("kyoto") == "KYOTO"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_cancels_call_when_last_waiter_cancelled():
+    started = asyncio.Event()
+    seen_cancel = asyncio.Event()
+
+    @ttl_cache(ttl_seconds=60)
+    async def slow_lookup(key: str) -> str:
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            seen_cancel.set()
+            raise
+        return key.upper()
+
+    caller = asyncio.create_task(slow_lookup("kyoto"))
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    await asyncio.wait_for(seen_cancel.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_keeps_call_while_other_waiters_remain():
+    started = asyncio.Event()
+
+    @ttl_cache(ttl_seconds=60)
+    async def slow_lookup(key: str) -> str:
+        started.set()
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    first = asyncio.create_task(slow_lookup("kyoto"))
+    second = asyncio.create_task(slow_lookup("kyoto"))
+    await started.wait()
+    first.cancel()
+
+    assert await second == "KYOTO"
+    with pytest.raises(asyncio.CancelledError):
+        await first
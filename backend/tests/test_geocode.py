@@ -1,13 +1,18 @@
+import asyncio
+
 import pytest
 import respx
 import httpx
 
+from app.services import geocode
 from app.services.geocode import geocode_place, GeocodeResult, NOMINATIM_URL
 
 
 @pytest.mark.asyncio
 @respx.mock
-async def test_geocode_place_parses_top_three_unique():
+async def test_geocode_place_parses_top_three_unique(monkeypatch):
+    # Force the live path; "bangalore" is also in the static table
+    monkeypatch.setenv("GEOCODE_STATIC_FIRST", "0")
     query = "Bangalore"
     # Mock response with duplicates & missing name entry
     respx.get(NOMINATIM_URL).mock(
@@ -29,3 +34,79 @@ async def test_geocode_place_parses_top_three_unique():
     names = [r.display_name for r in results]
     assert len(set(names)) == 3
     assert names[0].startswith("Bangalore")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_geocode_place_static_first_skips_network():
+    route = respx.get(NOMINATIM_URL)
+
+    results = await geocode_place("Bombay")
+    assert not route.called
+    assert len(results) == 1
+    assert results[0].display_name == "Mumbai, India"
+    assert results[0].source == "static"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_geocode_place_honours_retry_after(monkeypatch):
+    monkeypatch.setenv("GEOCODE_STATIC_FIRST", "0")
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr("app.services.geocode.asyncio.sleep", fake_sleep)
+    respx.get(NOMINATIM_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json=[{"display_name": "Kyoto, Japan", "lat": "35.01", "lon": "135.77"}]),
+        ]
+    )
+
+    results = await geocode_place("Kyoto")
+    assert sleeps == [2.0]
+    assert results[0].display_name == "Kyoto, Japan"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_geocode_place_coalesces_concurrent_lookups(monkeypatch):
+    monkeypatch.setenv("GEOCODE_STATIC_FIRST", "0")
+    route = respx.get(NOMINATIM_URL).mock(
+        return_value=httpx.Response(200, json=[{"display_name": "Venice, Italy", "lat": "45.44", "lon": "12.32"}])
+    )
+
+    first, second = await asyncio.gather(geocode_place("Venice"), geocode_place("venice "))
+    assert route.call_count == 1
+    assert first[0].display_name == second[0].display_name == "Venice, Italy"
+
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_geocode_place_cancels_request_when_last_waiter_cancelled(monkeypatch):
+    monkeypatch.setenv("GEOCODE_STATIC_FIRST", "0")
+    started = asyncio.Event()
+    seen_cancel = asyncio.Event()
+
+    async def hang(request):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            seen_cancel.set()
+            raise
+        return httpx.Response(200, json=[])
+
+    respx.get(NOMINATIM_URL).mock(side_effect=hang)
+
+    caller = asyncio.create_task(geocode_place("Atlantis"))
+    await started.wait()
+    caller.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await caller
+
+    await asyncio.wait_for(seen_cancel.wait(), timeout=1)
+    assert "atlantis" not in geocode._inflight
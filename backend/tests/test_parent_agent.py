@@ -0,0 +1,75 @@
+import pytest
+
+from app.agents import parent_agent
+from app.agents.parent_agent import detect_intent, extract_place_from_text
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        # Preposition path
+        ("weather in Paris", "Paris"),
+        ("I'm going to Bangalore, what's the weather?", "Bangalore"),
+        ("tell me about Rome", "Rome"),
+        ("Is it raining in London?", "London"),
+        ("temperature at Mount Everest base camp", "Mount Everest base camp"),
+        ("What is the   weather like in São   Paulo?", "São Paulo"),
+        ("weather in NY", "NY"),
+        # Capitalized-run fallback
+        ("Tokyo", "Tokyo"),
+        ("New York weather", "New York"),
+        ("Show me Tokyo", "Tokyo"),
+        ("How hot is Delhi", "Delhi"),
+        ("Visit Paris and London", "Paris"),
+        ("Kyoto and Osaka", "Kyoto"),
+        ("Show Me Goa", "Goa"),
+        # Nothing place-like
+        ("hello there", None),
+        ("Show me", None),
+    ],
+)
+def test_extract_place_from_text(message, expected):
+    assert extract_place_from_text(message) == expected
+
+
+@pytest.mark.parametrize(
+    "message, expected",
+    [
+        ("What's the weather in Paris?", {"weather"}),
+        ("Show me attractions in Rome", {"places"}),
+        ("Weather and places to visit in Goa", {"weather", "places"}),
+        # Plain substring semantics: "hotel" contains "hot", "parking" contains "park"
+        ("Find a hotel", {"weather"}),
+        ("parking near me", {"places"}),
+        ("RAIN in Tokyo", {"weather"}),
+        # No keyword at all defaults to places only
+        ("Lisbon", {"places"}),
+    ],
+)
+def test_detect_intent(message, expected):
+    assert detect_intent(message) == frozenset(expected)
+
+
+def test_detect_intent_already_lower_skips_lowercasing():
+    assert detect_intent("weather in kyoto", already_lower=True) == frozenset({"weather"})
+    # The caller promised lowercase input, so uppercase keywords are not seen
+    assert detect_intent("WEATHER IN KYOTO", already_lower=True) == frozenset({"places"})
+    assert detect_intent("WEATHER IN KYOTO") == frozenset({"weather"})
+
+
+def test_detect_intent_stops_scanning_once_both_found(monkeypatch):
+    consumed = []
+    real_re = parent_agent._INTENT_RE
+
+    class CountingRe:
+        def finditer(self, text):
+            for match in real_re.finditer(text):
+                consumed.append(match.group())
+                yield match
+
+    monkeypatch.setattr(parent_agent, "_INTENT_RE", CountingRe())
+
+    # Uncached variant so the spy sees the scan
+    intents = parent_agent._detect_intent("weather places rain forecast tour", already_lower=True)
+    assert intents == frozenset({"weather", "places"})
+    assert consumed == ["weather", "places"]
@@ -1,8 +1,12 @@
+import asyncio
+import json
+
 import pytest
 import respx
 import httpx
 
-from app.services.overpass import OVERPASS_URL, build_overpass_query, fetch_pois
+from app.agents.places_agent import fetch_places
+from app.services.overpass import OVERPASS_URL, build_overpass_query, fetch_pois, parse_overpass_elements
 
 
 @pytest.mark.asyncio
@@ -32,3 +36,122 @@ async def test_fetch_pois_parses_and_limits():
     assert "Lalbagh" in names
     assert "Cubbon Park" in names
     assert "Bangalore Palace" in names
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_pois_streams_and_stops_at_limit():
+    elements = [
+        {"type": "node", "lat": 12.9 + i / 100, "lon": 77.5, "tags": {"name": f"Spot {i}", "tourism": "attraction"}}
+        for i in range(100)
+    ]
+    body = json.dumps({"elements": elements}).encode()
+    chunk_size = 64
+    served = 0
+
+    async def chunks():
+        nonlocal served
+        for start in range(0, len(body), chunk_size):
+            served += 1
+            yield body[start:start + chunk_size]
+
+    respx.post(OVERPASS_URL).mock(return_value=httpx.Response(200, content=chunks()))
+
+    pois = await fetch_pois(12.97, 77.59, 5000, limit=3)
+    assert [p["name"] for p in pois] == ["Spot 0", "Spot 1", "Spot 2"]
+    assert pois[1]["lat"] == pytest.approx(12.91)
+    # Parsing stopped early instead of reading the whole body
+    assert served < len(body) // chunk_size
+
+
+@pytest.mark.asyncio
+async def test_fetch_places_merges_expanded_radius(monkeypatch):
+    calls = []
+
+    async def fake_fetch(lat, lon, radius, limit):
+        calls.append(radius)
+        if radius == 1000:
+            return [{"name": "Lalbagh"}, {"name": "Cubbon Park"}]
+        return [{"name": "Lalbagh"}, {"name": "Bangalore Palace"}, {"name": "ISKCON Temple"}]
+
+    monkeypatch.setattr("app.agents.places_agent._fetch", fake_fetch)
+
+    places = await fetch_places(12.97, 77.59, radius=1000, limit=4)
+    assert sorted(calls) == [1000, 2000]
+    names = [p["name"] for p in places]
+    assert len(names) == 4
+    assert len(set(names)) == 4
+    assert {"Lalbagh", "Cubbon Park", "Bangalore Palace"} <= set(names)
+
+
+@pytest.mark.asyncio
+async def test_fetch_places_prefers_initial_radius(monkeypatch):
+    async def fake_fetch(lat, lon, radius, limit):
+        if radius == 1000:
+            # Slower, but nearer results must still come first
+            await asyncio.sleep(0.01)
+            return [{"name": "Lalbagh"}, {"name": "Cubbon Park"}]
+        return [{"name": "Bangalore Palace"}, {"name": "ISKCON Temple"}, {"name": "Lalbagh"}]
+
+    monkeypatch.setattr("app.agents.places_agent._fetch", fake_fetch)
+
+    places = await fetch_places(12.97, 77.59, radius=1000, limit=3)
+    assert [p["name"] for p in places] == ["Lalbagh", "Cubbon Park", "Bangalore Palace"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_places_cancels_wider_radius_when_initial_fills_limit(monkeypatch):
+    wider_cancelled = asyncio.Event()
+
+    async def fake_fetch_pois(lat, lon, radius, limit):
+        if radius == 1000:
+            return [{"name": f"Spot {i}"} for i in range(limit)]
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            wider_cancelled.set()
+            raise
+        return []
+
+    monkeypatch.setattr("app.agents.places_agent.fetch_pois", fake_fetch_pois)
+
+    # Unique coordinates so the TTL cache on _fetch cannot answer
+    places = await fetch_places(-33.87, 151.21, radius=1000, limit=3)
+    assert [p["name"] for p in places] == ["Spot 0", "Spot 1", "Spot 2"]
+    await asyncio.wait_for(wider_cancelled.wait(), timeout=1)
+
+
+@pytest.mark.parametrize("stream_elements", [True, False])
+def test_parse_overpass_elements_from_bytes(monkeypatch, stream_elements):
+    # Covers both the ijson C-backend path and the orjson fallback
+    monkeypatch.setattr("app.services.overpass._STREAM_ELEMENTS", stream_elements)
+    body = json.dumps({
+        "elements": [
+            {"type": "node", "lat": 12.95, "lon": 77.58, "tags": {"name": "Lalbagh", "leisure": "park"}},
+            {"type": "way", "center": {"lat": 12.97, "lon": 77.59}, "tags": {"name": "Cubbon Park", "leisure": "park"}},
+            {"type": "node", "lat": 12.95, "lon": 77.58, "tags": {"name": "Lalbagh", "tourism": "attraction"}},
+            {"type": "node", "tags": {"amenity": "bench"}},
+            {"type": "node", "tags": {"name": "Extra Place", "historic": "ruins"}},
+        ]
+    }).encode()
+
+    pois = parse_overpass_elements(body, limit=2)
+    assert pois == [
+        {"name": "Lalbagh", "category": "leisure:park", "lat": 12.95, "lon": 77.58},
+        {"name": "Cubbon Park", "category": "leisure:park", "lat": 12.97, "lon": 77.59},
+    ]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_pois_without_ijson_c_backend(monkeypatch):
+    monkeypatch.setattr("app.services.overpass._STREAM_ELEMENTS", False)
+    respx.post(OVERPASS_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={"elements": [{"lat": 1.5, "lon": 2.5, "tags": {"name": "Louvre", "tourism": "museum"}}]},
+        )
+    )
+
+    pois = await fetch_pois(48.86, 2.34, 5000, limit=5)
+    assert pois == [{"name": "Louvre", "category": "tourism:museum", "lat": 1.5, "lon": 2.5}]
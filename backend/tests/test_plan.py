@@ -0,0 +1,55 @@
+import pytest
+import respx
+import httpx
+
+from app.api.plan import PlanRequest, PlanResponse, plan
+from app.services.geocode import NOMINATIM_URL
+from app.services.open_meteo import OPEN_METEO_URL
+from app.services.overpass import OVERPASS_URL
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_plan_response_matches_schema_strictly(monkeypatch):
+    # The response models are built with model_construct (no validation), so
+    # pin that the real agent outputs already carry the declared types.
+    monkeypatch.setenv("GEOCODE_STATIC_FIRST", "0")
+    respx.get(NOMINATIM_URL).mock(
+        return_value=httpx.Response(200, json=[{"display_name": "Reykjavik, Iceland", "lat": "64.15", "lon": "-21.94"}])
+    )
+    respx.get(OPEN_METEO_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "current_weather": {"temperature": 7, "time": "2025-05-01T10:00", "weathercode": 3},
+                "hourly": {"time": ["2025-05-01T10:00"], "precipitation_probability": [40]},
+                "daily": {
+                    "time": ["2025-05-01"],
+                    "temperature_2m_max": [9.5],
+                    "temperature_2m_min": [3.1],
+                    "precipitation_probability_max": [55],
+                    "weathercode": [61],
+                },
+            },
+        )
+    )
+    respx.post(OVERPASS_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "elements": [
+                    {"type": "node", "lat": 64.14, "lon": -21.93, "tags": {"name": "Hallgrimskirkja", "tourism": "attraction"}},
+                    {"type": "way", "center": {"lat": 64.15, "lon": -21.95}, "tags": {"name": "Tjornin", "leisure": "park"}},
+                ]
+            },
+        )
+    )
+
+    response = await plan(PlanRequest(message="Weather and places in Reykjavik"))
+
+    validated = PlanResponse.model_validate(response.model_dump(), strict=True)
+    assert validated.place == "Reykjavik, Iceland"
+    assert isinstance(response.lat, float) and isinstance(response.lon, float)
+    assert isinstance(response.weather.temperature, float)
+    assert response.weather.precipitation_probability == 40
+    assert response.places == ["Hallgrimskirkja", "Tjornin"]
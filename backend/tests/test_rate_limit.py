@@ -0,0 +1,151 @@
+from collections import OrderedDict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import rate_limit
+from app.middleware.rate_limit import RateLimitMiddleware
+
+
+class FakeClock:
+    """Stand-in for the `time` module so tests can move the window by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+def _fresh_limiter(monkeypatch, limit):
+    clock = FakeClock()
+    monkeypatch.setattr("app.middleware.rate_limit.time", clock)
+    monkeypatch.setattr("app.middleware.rate_limit.RATE_LIMIT_REQUESTS", limit)
+    monkeypatch.setattr("app.middleware.rate_limit._request_log", OrderedDict())
+    return clock
+
+
+def _client(monkeypatch, limit):
+    monkeypatch.setattr("app.middleware.rate_limit.RATE_LIMIT_REQUESTS", limit)
+    monkeypatch.setattr("app.middleware.rate_limit._request_log", OrderedDict())
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    return TestClient(app)
+
+
+def test_rate_limit_headers_then_429(monkeypatch):
+    client = _client(monkeypatch, limit=2)
+
+    first = client.get("/ping")
+    assert first.status_code == 200
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert client.get("/ping").headers["X-RateLimit-Remaining"] == "0"
+
+    blocked = client.get("/ping")
+    assert blocked.status_code == 429
+    assert blocked.headers["Retry-After"] == "60"
+    assert "Rate limit exceeded" in blocked.json()["detail"]
+
+    # Health checks bypass the limiter entirely
+    assert client.get("/health").status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_redis_counter_over_limit_blocks(monkeypatch):
+    calls = []
+
+    async def fake_counter(keys, args):
+        calls.append((keys, args))
+        return 3
+
+    monkeypatch.setattr("app.middleware.rate_limit.RATE_LIMIT_REQUESTS", 2)
+    monkeypatch.setattr("app.middleware.rate_limit._redis_counter", fake_counter)
+    monkeypatch.setattr("app.middleware.rate_limit._request_log", OrderedDict())
+
+    allowed, remaining, reset = await rate_limit._consume("10.0.0.1")
+    assert (allowed, remaining) == (False, 0)
+    assert reset % rate_limit.RATE_LIMIT_WINDOW == 0
+    assert calls[0][0][0].startswith("rl:10.0.0.1:")
+    assert calls[0][1] == [rate_limit.RATE_LIMIT_WINDOW]
+    # The shared counter decided; the in-memory window was not touched
+    assert not rate_limit._request_log
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_falls_back_to_memory(monkeypatch):
+    async def broken_counter(keys, args):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr("app.middleware.rate_limit.RATE_LIMIT_REQUESTS", 2)
+    monkeypatch.setattr("app.middleware.rate_limit._redis_counter", broken_counter)
+    monkeypatch.setattr("app.middleware.rate_limit._request_log", OrderedDict())
+
+    assert (await rate_limit._consume("10.0.0.2"))[:2] == (True, 1)
+    assert (await rate_limit._consume("10.0.0.2"))[:2] == (True, 0)
+    assert (await rate_limit._consume("10.0.0.2"))[:2] == (False, 0)
+    assert "10.0.0.2" in rate_limit._request_log
+
+
+def test_window_slides_and_ring_buffer_wraps(monkeypatch):
+    clock = _fresh_limiter(monkeypatch, limit=3)
+    window = rate_limit.RATE_LIMIT_WINDOW
+
+    for offset in (0, 10, 20):
+        clock.now = 1000.0 + offset
+        assert rate_limit._consume_local("10.0.0.1")[0]
+    clock.now = 1030.0
+    assert rate_limit._consume_local("10.0.0.1")[:2] == (False, 0)
+
+    # The t=0 entry leaves the window exactly `window` seconds later
+    clock.now = 1000.0 + window
+    assert rate_limit._consume_local("10.0.0.1")[:2] == (True, 0)
+    assert not rate_limit._consume_local("10.0.0.1")[0]
+
+    # Keep cycling well past the buffer size: steady traffic at the limit
+    # rate is always allowed, one extra request per window never is.
+    for step in range(1, 10):
+        clock.now = 1000.0 + window + step * (window / 3)
+        assert rate_limit._consume_local("10.0.0.1")[0]
+    assert not rate_limit._consume_local("10.0.0.1")[0]
+
+    # A long idle gap empties the window entirely
+    clock.now += 10 * window
+    assert rate_limit._consume_local("10.0.0.1")[:2] == (True, 2)
+
+
+def test_lru_cap_evicts_least_recently_seen_ip(monkeypatch):
+    clock = _fresh_limiter(monkeypatch, limit=5)
+    monkeypatch.setattr("app.middleware.rate_limit.MAX_TRACKED_IPS", 2)
+
+    for ip in ("a", "b", "a", "c"):
+        clock.now += 1
+        rate_limit._consume_local(ip)
+
+    # "b" was touched least recently once "a" was seen again
+    assert list(rate_limit._request_log) == ["a", "c"]
+
+
+def test_prune_removes_expired_clients(monkeypatch):
+    clock = _fresh_limiter(monkeypatch, limit=5)
+
+    rate_limit._consume_local("old")
+    clock.now += 50
+    rate_limit._consume_local("recent")
+    clock.now += 20
+
+    assert rate_limit.prune_request_log() == 1
+    assert list(rate_limit._request_log) == ["recent"]
@@ -29,3 +29,63 @@ async def test_fetch_open_meteo_time_matching_precip():
     assert data["temperature"] == pytest.approx(24.3)
     assert data["precipitation_probability"] == 35
     assert data["summary"] == "Clear"
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_fetch_open_meteo_forecast_pads_short_arrays():
+    respx.get(OPEN_METEO_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "current_weather": {"temperature": 20.0, "time": "2025-05-01T10:00", "weathercode": 3},
+                "daily": {
+                    "time": [f"2025-05-0{d}" for d in range(1, 10)],
+                    "temperature_2m_max": [30.0, 31.0],
+                    "temperature_2m_min": [20.0, 21.0],
+                    "precipitation_probability_max": [10, 20],
+                    "weathercode": [0, 1234],
+                },
+            },
+        )
+    )
+
+    data = await fetch_open_meteo(12.97, 77.59)
+    forecast = data["forecast"]
+    assert len(forecast) == 7
+    assert forecast[0]["summary"] == "Clear"
+    assert forecast[1]["summary"] == "Unknown"
+    assert forecast[2] == {
+        "date": "2025-05-03",
+        "temp_max": None,
+        "temp_min": None,
+        "precipitation_probability": None,
+        "summary": None,
+    }
+
+
+@pytest.mark.asyncio
+@respx.mock
+@pytest.mark.parametrize(
+    "current_time, hourly_times",
+    [
+        ("2025-05-01T10:00", ["2025-05-01T09:00", None, "2025-05-01T11:00"]),
+        (None, ["2025-05-01T09:00", "2025-05-01T10:00"]),
+        (1746093600, ["2025-05-01T09:00", "2025-05-01T10:00"]),
+    ],
+)
+async def test_fetch_open_meteo_unorderable_times_skip_precip(current_time, hourly_times):
+    respx.get(OPEN_METEO_URL).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "current_weather": {"temperature": 18.5, "time": current_time, "weathercode": 0},
+                "hourly": {"time": hourly_times, "precipitation_probability": [10, 35, 5]},
+            },
+        )
+    )
+
+    data = await fetch_open_meteo(48.85, 2.35)
+    assert data["temperature"] == pytest.approx(18.5)
+    assert data["precipitation_probability"] is None
+    assert data["summary"] == "Clear"